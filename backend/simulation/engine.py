@@ -16,7 +16,7 @@ class SimulationState(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationSnapshot:
     """Complete state snapshot for frontend consumption."""
 
@@ -19,7 +19,7 @@ class CellType(Enum):
     OBSTACLE = "obstacle"
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """A single cell in the simulation grid.
 
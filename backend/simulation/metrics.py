@@ -6,7 +6,7 @@ from typing import Any
 from .vehicle import Vehicle
 
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """Tracks and calculates performance metrics for the simulation.
 
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from .traffic_light import TrafficLightManager
 
 
-@dataclass
+@dataclass(slots=True)
 class PathNode:
     """A node in the A* search algorithm.
 
@@ -26,7 +26,7 @@ class Phase(Enum):
     RED = "red"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrafficLight:
     """A traffic light at an intersection.
 
@@ -27,15 +27,15 @@ class VehicleStatus(Enum):
     ARRIVED = "arrived"
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     """A vehicle entity in the simulation.
 
-    Each vehicle has a unique ID, type, position, path, and status.
+    Each vehicle has a unique integer ID, type, position, path, and status.
     The path is pre-computed at spawn time and not modified during movement.
     """
 
-    id: str
+    id: int
     type: VehicleType
     position: tuple[int, int]
     origin: tuple[int, int]